@@ -22,7 +22,11 @@ _METADATA_KEYWORDS = [
     r"(?:最大等待秒数|max_wait_seconds)\s*[:：]",
     r"(?:心情|情绪|mood)\s*[:：]",
 ]
-_METADATA_PATTERNS = [re.compile(kw, re.IGNORECASE) for kw in _METADATA_KEYWORDS]
+# 合并为单个带命名分组的模式，一次扫描即可统计命中的关键字类别与最早位置
+_METADATA_PATTERN = re.compile(
+    "|".join(f"(?P<k{i}>{kw})" for i, kw in enumerate(_METADATA_KEYWORDS)),
+    re.IGNORECASE,
+)
 
 
 # KFC 元数据字段：通过 schema 强制 LLM 每次调用都明确给出，
@@ -129,15 +133,17 @@ class KFCReplyAction(BaseAction):
             return False, "内容为空，未发送"
 
         # 最后防线：仅当 >=2 个元数据关键字同时出现时才截断，降低误伤
-        keyword_matches = [
-            p.search(segment) for p in _METADATA_PATTERNS
-        ]
-        hit_count = sum(1 for m in keyword_matches if m is not None)
+        # 所有模式都以冒号结尾，不含冒号的常见情况直接跳过正则扫描
+        hit_groups: set[str] = set()
+        earliest = -1
+        if ":" in segment or "：" in segment:
+            for match in _METADATA_PATTERN.finditer(segment):
+                if earliest < 0:
+                    # finditer 按位置顺序产出，第一个匹配即最早位置
+                    earliest = match.start()
+                hit_groups.add(match.lastgroup or "")
+        hit_count = len(hit_groups)
         if hit_count >= 2:
-            # 找到最早的匹配位置进行截断
-            earliest = min(
-                (m.start() for m in keyword_matches if m is not None),
-            )
             cleaned = segment[:earliest].strip()
             logger.warning(
                 f"[最后防线] 检测到 content 中混入 {hit_count} 个元数据关键字，已截断。"
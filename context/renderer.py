@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from src.app.plugin_system.api.prompt_api import get_template as _get_prompt_template
 from src.app.plugin_system.types import Content, LLMPayload, ROLE, Text
 
+from ..prompts.templates import KFC_MENTAL_LOG_HINT
 from .sources.history_source import (
     build_channel_payload,
     build_current_time_payload,
@@ -137,28 +138,29 @@ class ContextRenderer:
         ``on_prompt_build`` 事件给第三方动态注入器修改。动态上下文统一
         通过 ``kfc_user_prompt`` 的 ``context_contributions`` 注入。
         """
-        from ..prompts.modules import build_mental_log_hint
-
         tmpl_base = _get_prompt_template("kfc_system_prompt")
         if not tmpl_base:
             return ""
 
-        tmpl = tmpl_base.clone()
-        tmpl.set("platform", chat_stream.platform or "unknown")
-        tmpl.set("chat_type", str(chat_stream.chat_type or "unknown"))
-        tmpl.set("bot_id", chat_stream.bot_id or "")
-        tmpl.set("stream_id", chat_stream.stream_id or "")
-        tmpl.set("mental_log_hint", build_mental_log_hint())
-        tmpl.set("theme_guide", "")
-
+        # 直接组装一次性的变量字典交给 _render，不 clone 全局模板、不逐个 set
+        values = dict(tmpl_base.values)
+        values.update(
+            {
+                "platform": chat_stream.platform or "unknown",
+                "chat_type": str(chat_stream.chat_type or "unknown"),
+                "bot_id": chat_stream.bot_id or "",
+                "stream_id": chat_stream.stream_id or "",
+                "mental_log_hint": KFC_MENTAL_LOG_HINT,
+                "theme_guide": "",
+            }
+        )
         if extra_vars:
-            for key, value in extra_vars.items():
-                tmpl.set(key, value)
+            values.update(extra_vars)
 
-        return tmpl._render(  # noqa: SLF001 - KFC 系统提示词必须跳过 on_prompt_build 事件
-            tmpl.template,
-            dict(tmpl.values),
-            dict(tmpl.policies),
+        return tmpl_base._render(  # noqa: SLF001 - KFC 系统提示词必须跳过 on_prompt_build 事件
+            tmpl_base.template,
+            values,
+            dict(tmpl_base.policies),
             strict=False,
         )
 
@@ -198,11 +200,12 @@ class ContextRenderer:
         if not turn_contributions:
             return None
 
-        joined_contents = "\n\n".join(
+        # 每个 owner 分区只渲染一次，空分区在拼接时跳过
+        owner_blocks = [
             self._render_owner_contribution_block(owner, turn_contributions)
             for owner in self._OWNER_RENDER_ORDER
-            if self._render_owner_contribution_block(owner, turn_contributions)
-        )
+        ]
+        joined_contents = "\n\n".join(block for block in owner_blocks if block)
         if not joined_contents:
             return None
 
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import datetime
+import time
+from operator import itemgetter
 from typing import Any
 
 from src.app.plugin_system.types import LLMPayload, ROLE, Text
@@ -15,6 +17,11 @@ from ...models import KFCEventType
 _MENTAL_LOG_LOOKBACK = 7
 
 
+def _format_ts(ts: float) -> str:
+    """将时间戳格式化为 ``%Y-%m-%d %H:%M:%S``，不构造 datetime 对象。"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+
+
 def build_history_summary_payload(
     chat_stream: Any,
     history_summary: str,
@@ -115,32 +122,35 @@ def build_fused_narrative(
     before_ts: float | None = None,
 ) -> str:
     """构建聊天历史与内心独白的融合叙事。"""
-    msgs: list[Any] = list(chat_stream.context.history_messages)
+    # 循环内没有 await，直接迭代原序列即可，无需先复制一份
+    msgs = chat_stream.context.history_messages or ()
+    if not msgs and not mental_log:
+        return ""
     bot_id = str(chat_stream.bot_id or "")
     timeline: list[tuple[float, str]] = []
+    format_ts = _format_ts
 
     for msg in msgs:
         raw_time = msg.time
         if not isinstance(raw_time, (int, float)):
             continue
         ts = float(raw_time)
-        try:
-            time_str = datetime.datetime.fromtimestamp(ts).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-        except (OSError, ValueError, OverflowError):
+        if before_ts is not None and ts >= before_ts:
             continue
 
-        sender = msg.sender_name or "未知"
-        sender_id = msg.sender_id or ""
-        message_id = msg.message_id or ""
         text = msg.processed_plain_text or ""
         if not text or not text.strip():
             continue
 
-        if before_ts is not None and ts >= before_ts:
+        # 廉价过滤在前，时间格式化只对真正进入时间线的消息执行
+        try:
+            time_str = format_ts(ts)
+        except (OSError, ValueError, OverflowError):
             continue
 
+        sender_id = msg.sender_id or ""
+        message_id = msg.message_id or ""
+
         is_bot = bool(
             (bot_id and sender_id == bot_id)
             or message_id.startswith("action_kfc_reply")
@@ -148,11 +158,16 @@ def build_fused_narrative(
         if is_bot:
             timeline.append((ts, f"[{time_str}] 你回复：{text}"))
         else:
+            # 发送者昵称只在对方消息中使用，Bot 自身消息不必读取
+            sender = msg.sender_name or "未知"
             msg_id_part = f" [消息id:{message_id}]" if message_id else ""
             timeline.append((ts, f"[{time_str}] {sender}{msg_id_part}说：{text}"))
 
-    chat_timestamps = [ts for ts, _ in timeline]
-    mental_cutoff = chat_timestamps[-_MENTAL_LOG_LOOKBACK] if len(chat_timestamps) >= _MENTAL_LOG_LOOKBACK else 0.0
+    mental_cutoff = (
+        timeline[-_MENTAL_LOG_LOOKBACK][0]
+        if len(timeline) >= _MENTAL_LOG_LOOKBACK
+        else 0.0
+    )
 
     for entry in (mental_log.entries if mental_log else []):
         if not isinstance(entry.timestamp, (int, float)):
@@ -160,22 +175,22 @@ def build_fused_narrative(
         if entry.timestamp < mental_cutoff:
             continue
         ts = entry.timestamp
-        try:
-            time_str = datetime.datetime.fromtimestamp(ts).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-        except (OSError, ValueError, OverflowError):
+        if before_ts is not None and ts >= before_ts:
+            continue
+        if entry.event_type != KFCEventType.BOT_PLANNING or not entry.thought:
             continue
 
-        if before_ts is not None and entry.timestamp >= before_ts:
+        try:
+            time_str = format_ts(ts)
+        except (OSError, ValueError, OverflowError):
             continue
 
-        if entry.event_type == KFCEventType.BOT_PLANNING and entry.thought:
-            timeline.append((ts, f"[{time_str}] （你的内心：{entry.thought}）"))
+        timeline.append((ts, f"[{time_str}] （你的内心：{entry.thought}）"))
 
     if not timeline:
         return ""
 
-    timeline.sort(key=lambda item: item[0])
-    lines = [item[1] for item in timeline]
+    # 历史消息不保证按时间排列，需整体排序；稳定排序下时间戳相同时聊天记录在前
+    timeline.sort(key=itemgetter(0))
+    lines = [line for _, line in timeline]
     return "以下为融合了聊天记录与你内心活动的时间线：\n" + "\n".join(lines)
@@ -106,10 +106,7 @@ async def execute_decision_draft(
             if not send_ok:
                 result.has_failed_tool = True
 
-            action_dict: dict[str, Any] = {"type": normalized_name}
-            action_dict.update(args)
-            action_dict["content"] = segments
-            result.actions.append(action_dict)
+            result.actions.append({"type": normalized_name, **args, "content": segments})
             response.add_payload(
                 LLMPayload(
                     ROLE.TOOL_RESULT,
@@ -125,9 +122,7 @@ async def execute_decision_draft(
         if normalized_name == DO_NOTHING:
             result.has_do_nothing = True
             extract_metadata(result, args)
-            action_dict = {"type": normalized_name}
-            action_dict.update(args)
-            result.actions.append(action_dict)
+            result.actions.append({"type": normalized_name, **args})
             response.add_payload(
                 LLMPayload(
                     ROLE.TOOL_RESULT,
@@ -143,9 +138,7 @@ async def execute_decision_draft(
         if normalized_name == PASS_AND_WAIT:
             result.has_pass_and_wait = True
             extract_metadata(result, args)
-            action_dict = {"type": normalized_name}
-            action_dict.update(args)
-            result.actions.append(action_dict)
+            result.actions.append({"type": normalized_name, **args})
             response.add_payload(
                 LLMPayload(
                     ROLE.TOOL_RESULT,
@@ -161,9 +154,7 @@ async def execute_decision_draft(
         result.has_third_party = True
         if draft_call.raw_name.startswith(("agent-", "tool-")):
             result.has_info_tool = True
-        action_dict = {"type": normalized_name}
-        action_dict.update(args)
-        result.actions.append(action_dict)
+        result.actions.append({"type": normalized_name, **args})
         pending_framework_calls.append(draft_call.raw_call)
 
     await flush_pending_framework_calls()
@@ -13,7 +13,7 @@ from typing import Any
 from .models import KFCEventType
 
 
-@dataclass
+@dataclass(slots=True)
 class MentalLogEntry:
     """心理活动日志条目，记录活动流中的单个事件。"""
 
@@ -98,9 +98,13 @@ class MentalLog:
     管理 MentalLogEntry 的添加、查询、裁剪和格式化。
     """
 
+    __slots__ = ("_entries", "_max_entries", "_cached_list")
+
     def __init__(self, max_entries: int = 50) -> None:
         self._entries: list[MentalLogEntry] = []
         self._max_entries = max_entries
+        # to_list() 的序列化结果缓存，条目增删时置 None
+        self._cached_list: list[dict[str, Any]] | None = None
 
     @property
     def entries(self) -> list[MentalLogEntry]:
@@ -135,6 +139,7 @@ class MentalLog:
         self._entries.append(entry)
         if len(self._entries) > self._max_entries:
             self._entries = self._entries[-self._max_entries :]
+        self._cached_list = None
 
     def get_recent(self, n: int = 20) -> list[MentalLogEntry]:
         """获取最近 n 条条目。"""
@@ -189,8 +194,14 @@ class MentalLog:
         return "\n".join(lines)
 
     def to_list(self) -> list[dict[str, Any]]:
-        """序列化为字典列表。"""
-        return [e.to_dict() for e in self._entries]
+        """序列化为字典列表。
+
+        条目在 add() 之后不再被修改，结果可在下一次增删前复用；
+        返回浅拷贝，调用方增删列表元素不会污染缓存。
+        """
+        if self._cached_list is None:
+            self._cached_list = [e.to_dict() for e in self._entries]
+        return list(self._cached_list)
 
     @classmethod
     def from_list(cls, data: list[dict[str, Any]], max_entries: int = 50) -> MentalLog:
@@ -206,6 +217,7 @@ class MentalLog:
     def clear(self) -> None:
         """清空所有条目。"""
         self._entries.clear()
+        self._cached_list = None
 
     @staticmethod
     def _format_entry_narrative(entry: MentalLogEntry, time_str: str) -> str:
@@ -201,7 +201,7 @@ def clamp_expire_hours(raw: float) -> float:
     return max(MEMO_MIN_EXPIRE_HOURS, min(value, MEMO_MAX_EXPIRE_HOURS))
 
 
-@dataclass
+@dataclass(slots=True)
 class WaitingConfig:
     """等待配置，当 Bot 发送消息后设置的等待参数。"""
 
@@ -209,28 +209,48 @@ class WaitingConfig:
     max_wait_seconds: float = 0.0
     started_at: float = 0.0
     followup_count: int = 0
+    # 进程内单调时钟起点，仅由 start() 设置、不参与序列化；
+    # 为 0 时（如从磁盘恢复）回退到墙钟 started_at 计算
+    _monotonic_start: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    @classmethod
+    def start(cls, expected_reaction: str, max_wait_seconds: float) -> WaitingConfig:
+        """以当前时刻为起点创建等待配置。"""
+        config = cls(
+            expected_reaction=expected_reaction,
+            max_wait_seconds=max_wait_seconds,
+            started_at=time.time(),
+        )
+        config._monotonic_start = time.monotonic()
+        return config
 
     def is_active(self) -> bool:
         """是否正在等待。"""
         return self.max_wait_seconds > 0 and self.started_at > 0
 
+    def _elapsed_since_start(self) -> float:
+        """已等待时间（秒），调用方需已确认处于等待状态。"""
+        if self._monotonic_start > 0:
+            return time.monotonic() - self._monotonic_start
+        return time.time() - self.started_at
+
     def get_elapsed_seconds(self) -> float:
         """获取已等待时间（秒）。"""
         if not self.is_active():
             return 0.0
-        return time.time() - self.started_at
+        return self._elapsed_since_start()
 
     def is_timeout(self) -> bool:
         """是否已超时。"""
         if not self.is_active():
             return False
-        return self.get_elapsed_seconds() >= self.max_wait_seconds
+        return self._elapsed_since_start() >= self.max_wait_seconds
 
     def get_progress(self) -> float:
         """获取等待进度 (0.0~1.0)。"""
-        if not self.is_active() or self.max_wait_seconds <= 0:
+        if not self.is_active():
             return 0.0
-        return min(self.get_elapsed_seconds() / self.max_wait_seconds, 1.0)
+        return min(self._elapsed_since_start() / self.max_wait_seconds, 1.0)
 
     def reset(self) -> None:
         """重置等待配置。"""
@@ -238,6 +258,7 @@ class WaitingConfig:
         self.max_wait_seconds = 0.0
         self.started_at = 0.0
         self.followup_count = 0
+        self._monotonic_start = 0.0
 
     def to_dict(self) -> dict[str, Any]:
         """序列化为字典。"""
@@ -73,8 +73,7 @@ def extract_images_from_messages(
     """
     items: list[dict[str, Any]] = []
     for msg in messages:
-        for media in get_image_media_list(msg):
-            items.append(media)
+        items.extend(get_image_media_list(msg))
     return items
 
 
@@ -91,7 +90,5 @@ def build_multimodal_content(
     Returns:
         ``[Text(text), Image(data1), Image(data2), ...]`` 格式的内容列表
     """
-    content_list: list[Content] = [Text(text)]
-    for item in media_items:
-        content_list.append(Image(str(item["data"])))
-    return content_list
+    # 一次性按最终长度构建，避免逐项 append 的扩容
+    return [Text(text), *[Image(str(item["data"])) for item in media_items]]
@@ -147,12 +147,17 @@ class KFCPlugin(BasePlugin):
             async def proactive_check() -> None:
                 """定期检查是否需要主动发起。"""
                 triggered = await proactive.check_all_sessions()
-                for stream_id in triggered:
-                    scheduled_reason = await proactive.mark_triggered(stream_id)
-                    logger.info(f"主动发起触发: {stream_id[:8]}")
-                    # 通过事件 API 触发 chatter
-                    from src.app.plugin_system.api.event_api import publish_event
+                if not triggered:
+                    return
+
+                # 先并发落盘所有触发标记，再按顺序发布事件；标记失败的 stream 不发布
+                scheduled_reasons = await proactive.mark_triggered_many(triggered)
 
+                # 通过事件 API 触发 chatter
+                from src.app.plugin_system.api.event_api import publish_event
+
+                for stream_id, scheduled_reason in scheduled_reasons.items():
+                    logger.info(f"主动发起触发: {stream_id[:8]}")
                     await publish_event(
                         "kfc.proactive_trigger",
                         {"stream_id": stream_id, "scheduled_reason": scheduled_reason},
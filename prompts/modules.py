@@ -59,9 +59,6 @@ def register_kfc_prompts() -> None:
             "scene_state_info": optional(""),
             # reply_mode_instruction 由 _build_initial_context 动态注入，此处提供 tool calling 兜底
             "reply_mode_instruction": optional(KFC_REPLY_MODE_TOOL_CALLING),
-            "current_time": optional(
-                datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            ),
         },
     )
 
@@ -79,14 +76,6 @@ def register_kfc_prompts() -> None:
     )
 
 
-def build_mental_log_hint() -> str:
-    """构建活动流格式提示。"""
-    return (
-        "你的活动流会以线性叙事的形式呈现在消息中，"
-        "帮助你回顾之前的互动和内心活动。"
-    )
-
-
 async def build_proactive_context(
     silence_minutes: float,
     recent_activity: str,
@@ -50,6 +50,8 @@ KFC_REPLY_MODE_TOOL_CALLING = """你的所有交互行为都是基于工具调
 
 
 # ─── 主系统提示词 ───────────────────────────────────────────
+# 顺序即缓存边界：仅随配置变化的内容在前，随会话变化的场景状态/预约信息
+# 放在最末尾，尽量延长跨轮次、跨会话完全一致的前缀。
 KFC_SYSTEM_PROMPT = """<existence_logic>
 你的名字是 {nickname}，也被称为 {alias_names}。
 你应当自然的与对方交流，而不是机械地回答问题。
@@ -109,14 +111,21 @@ KFC_SYSTEM_PROMPT = """<existence_logic>
 
 <stable_context>
 {mental_log_hint}
-{scene_state_info}
-{scheduled_proactive_info}
 {theme_guide}
 {custom_decision_prompt}
+{scene_state_info}
+{scheduled_proactive_info}
 </stable_context>
 """
 
 
+# ─── 活动流格式提示 ────────────────────────────────────────────
+KFC_MENTAL_LOG_HINT = (
+    "你的活动流会以线性叙事的形式呈现在消息中，"
+    "帮助你回顾之前的互动和内心活动。"
+)
+
+
 # ─── 主动发起决策指令（按模式区分） ──────────────────────────
 KFC_PROACTIVE_DECISION_TOOL_CALLING = """如果你产生了真实的表达欲，请通过调用 `action-kfc_reply` 工具来执行你的决策。
 如果你认为目前的沉默是有意义的，请通过调用 `action-do_nothing` 工具来保持对话状态。"""
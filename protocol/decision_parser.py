@@ -8,19 +8,7 @@ from typing import Any
 
 from ..domain.decision import Decision, ProactiveSchedule, ToolCallSpec
 from ..models import DO_NOTHING, KFC_REPLY, PASS_AND_WAIT, ToolCallResult
-from .tool_call_adapter import build_decision_draft
-
-
-def _normalize_call_name(name: str) -> str:
-    """归一化工具调用名称。"""
-    if not name:
-        return ""
-    if ":" in name:
-        return name.rsplit(":", 1)[-1]
-    for prefix in ("action-", "tool-", "agent-"):
-        if name.startswith(prefix):
-            return name[len(prefix) :]
-    return name
+from .tool_call_adapter import build_decision_draft, normalize_call_name as _normalize_call_name
 
 
 def _extract_args(raw_args: Any) -> dict[str, Any]:
@@ -12,7 +12,7 @@ from typing import Any
 from src.app.plugin_system.types import ToolCall
 
 from ..models import DO_NOTHING, KFC_REPLY
-from ..parser import _ensure_call_id
+from ..parser import _ensure_call_id, _normalize_call_name as normalize_call_name
 
 
 @dataclass(slots=True)
@@ -38,18 +38,6 @@ class DecisionDraft:
         return bool(self.calls)
 
 
-def normalize_call_name(name: str) -> str:
-    """归一化工具调用名称。"""
-    if not name:
-        return ""
-    if ":" in name:
-        return name.rsplit(":", 1)[-1]
-    for prefix in ("action-", "tool-", "agent-"):
-        if name.startswith(prefix):
-            return name[len(prefix) :]
-    return name
-
-
 def extract_call_args(raw_args: Any) -> dict[str, Any]:
     """提取工具参数字典，兼容字符串 JSON。"""
     if isinstance(raw_args, dict):
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -361,10 +360,9 @@ async def commit_turn_decision(
         is_final_timeout = False
 
     if wait_seconds > 0:
-        waiting_config = WaitingConfig(
+        waiting_config = WaitingConfig.start(
             expected_reaction=decision.expected_reaction,
             max_wait_seconds=wait_seconds,
-            started_at=time.time(),
         )
         session.set_waiting(waiting_config)
         await chatter._save_session(session)
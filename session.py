@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+import weakref
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
@@ -27,7 +28,7 @@ from .models import (
 logger = get_logger("kfc_session")
 
 
-@dataclass
+@dataclass(slots=True)
 class KFCSession:
     """KFC 会话状态数据。"""
 
@@ -429,14 +430,26 @@ class KFCSessionStore:
     def __init__(self, max_log_entries: int = 50) -> None:
         self._sessions: dict[str, KFCSession] = {}
         self._store_initialized = False
-        self._locks: dict[str, asyncio.Lock] = {}
+        # 弱引用锁表：锁仅在被持有或等待时存活，空闲后随 GC 自动回收
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
         self._max_log_entries = max_log_entries
+        # 已写入 _index.json 的 (platform, user_id)，未变化时跳过索引文件读写
+        self._indexed: dict[str, tuple[str, str]] = {}
+        # _index.json 为整文件读改写，并发 save 时需串行，避免互相覆盖条目
+        self._index_lock = asyncio.Lock()
 
     def _get_lock(self, stream_id: str) -> asyncio.Lock:
-        """获取指定 stream_id 的锁（惰性创建）。"""
-        if stream_id not in self._locks:
-            self._locks[stream_id] = asyncio.Lock()
-        return self._locks[stream_id]
+        """获取指定 stream_id 的锁（惰性创建）。
+
+        调用方在 ``async with`` 期间持有强引用，锁不会在临界区内被回收。
+        """
+        lock = self._locks.get(stream_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[stream_id] = lock
+        return lock
 
     @asynccontextmanager
     async def lock(self, stream_id: str) -> AsyncIterator[None]:
@@ -516,12 +529,6 @@ class KFCSessionStore:
                     f"Session 持久化失败 (stream={session.stream_id[:8]}): {e}"
                 )
 
-        # 锁字典膨胀时定期清理不活跃的锁
-        if len(self._locks) > 100:
-            cleaned = self.cleanup_inactive_locks()
-            if cleaned:
-                logger.debug(f"清理了 {cleaned} 个不活跃的锁")
-
     async def get(self, stream_id: str) -> KFCSession | None:
         """获取 Session（不创建）。"""
         if stream_id in self._sessions:
@@ -568,22 +575,6 @@ class KFCSessionStore:
         """获取所有缓存中的 Session（不触发 IO）。"""
         return dict(self._sessions)
 
-    def cleanup_inactive_locks(self) -> int:
-        """清理不活跃 stream 的锁，释放内存。
-
-        移除不在缓存中且当前未被持有的锁。
-
-        Returns:
-            int: 被清理的锁数量
-        """
-        stale = [
-            sid for sid, lock in self._locks.items()
-            if sid not in self._sessions and not lock.locked()
-        ]
-        for sid in stale:
-            del self._locks[sid]
-        return len(stale)
-
     async def list_all_stream_ids(self) -> list[str]:
         """列出所有已持久化的 stream_id。
 
@@ -608,31 +599,38 @@ class KFCSessionStore:
         """更新 _index.json 索引文件（stream_id → 可读标识映射）。
 
         每次 save() 后自动调用，让用户可通过 _index.json 对照文件名与 QQ 号。
+        本进程内已写入且映射未变化时直接返回，避免每次保存都重写整个索引文件。
         """
         import json as _json
 
         if self._json_store is None:
             return
 
-        index_path = self._json_store.get_storage_dir() / "_index.json"
+        indexed_key = (session.platform, session.user_id)
+        if self._indexed.get(session.stream_id) == indexed_key:
+            return
 
-        # 读取现有索引
-        try:
-            raw = await asyncio.to_thread(index_path.read_bytes)
-            index: dict[str, dict[str, str]] = _json.loads(raw)
-        except (FileNotFoundError, _json.JSONDecodeError):
-            index = {}
-
-        # 更新当前 session 的条目
-        entry: dict[str, str] = {
-            "platform": session.platform,
-            "user_id": session.user_id,
-        }
-        index[session.stream_id] = entry
+        async with self._index_lock:
+            index_path = self._json_store.get_storage_dir() / "_index.json"
 
-        # 写回
-        try:
-            data_bytes = _json.dumps(index, ensure_ascii=False, indent=2).encode("utf-8")
-            await asyncio.to_thread(index_path.write_bytes, data_bytes)
-        except Exception as e:
-            logger.debug(f"索引文件写入失败: {e}")
+            # 读取现有索引
+            try:
+                raw = await asyncio.to_thread(index_path.read_bytes)
+                index: dict[str, dict[str, str]] = _json.loads(raw)
+            except (FileNotFoundError, _json.JSONDecodeError):
+                index = {}
+
+            # 更新当前 session 的条目
+            entry: dict[str, str] = {
+                "platform": session.platform,
+                "user_id": session.user_id,
+            }
+            index[session.stream_id] = entry
+
+            # 写回
+            try:
+                data_bytes = _json.dumps(index, ensure_ascii=False, indent=2).encode("utf-8")
+                await asyncio.to_thread(index_path.write_bytes, data_bytes)
+                self._indexed[session.stream_id] = indexed_key
+            except Exception as e:
+                logger.debug(f"索引文件写入失败: {e}")
@@ -931,6 +931,17 @@ def test_history_source_payload_builders_and_fused_narrative() -> None:
     assert "坏时间" not in narrative
     assert build_fused_narrative(SimpleNamespace(bot_id="bot", context=SimpleNamespace(history_messages=[])), None) == ""
 
+    unordered = [
+        SimpleNamespace(time=10.0, sender_name="A", sender_id="u", message_id="m10", processed_plain_text="后发"),
+        SimpleNamespace(time=5.0, sender_name="A", sender_id="u", message_id="m5", processed_plain_text="先发"),
+    ]
+    unordered_log = SimpleNamespace(
+        entries=[SimpleNamespace(timestamp=7.0, event_type=KFCEventType.BOT_PLANNING, thought="中间")]
+    )
+    unordered_stream = SimpleNamespace(bot_id="bot", context=SimpleNamespace(history_messages=unordered))
+    lines = build_fused_narrative(unordered_stream, unordered_log).splitlines()[1:]
+    assert [line.rsplit("：", 1)[-1] for line in lines] == ["先发", "中间）", "后发"]
+
 
 def test_models_waiting_config_and_visible_reply_text(monkeypatch: pytest.MonkeyPatch) -> None:
     """models 中的等待配置和可见回复提取应覆盖所有分支。"""
@@ -971,6 +982,37 @@ def test_models_waiting_config_and_visible_reply_text(monkeypatch: pytest.Monkey
     assert active.to_dict() == {"expected_reaction": "", "max_wait_seconds": 0.0, "started_at": 0.0, "followup_count": 0}
 
 
+def test_models_waiting_config_start_uses_monotonic_until_restored(monkeypatch: pytest.MonkeyPatch) -> None:
+    """start() 在进程内按单调时钟计时，序列化恢复后回退到墙钟 started_at。"""
+    from plugins.kokoro_flow_chatter.models import WaitingConfig
+
+    wall = [1000.0]
+    mono = [50.0]
+    monkeypatch.setattr("plugins.kokoro_flow_chatter.models.time.time", lambda: wall[0])
+    monkeypatch.setattr("plugins.kokoro_flow_chatter.models.time.monotonic", lambda: mono[0])
+
+    started = WaitingConfig.start("回", 10)
+    assert started.started_at == 1000.0
+    assert started.is_active() is True
+
+    # 墙钟被回拨时，进程内计时仍以单调时钟为准
+    wall[0] = 900.0
+    mono[0] = 54.0
+    assert started.get_elapsed_seconds() == 4.0
+    assert started.is_timeout() is False
+    assert started.get_progress() == 0.4
+
+    data = started.to_dict()
+    assert data == {"expected_reaction": "回", "max_wait_seconds": 10, "started_at": 1000.0, "followup_count": 0}
+
+    restored = WaitingConfig.from_dict(data)
+    wall[0] = 1012.0
+    mono[0] = 0.5
+    assert restored.get_elapsed_seconds() == 12.0
+    assert restored.is_timeout() is True
+    assert restored.get_progress() == 1.0
+
+
 @pytest.mark.asyncio
 async def test_parse_response_decision_delegates_execution() -> None:
     """parse_response_decision 应从 response.call_list 到 Decision 完整收敛。"""
@@ -1117,3 +1159,286 @@ async def test_unread_policy_prefers_real_messages_and_filters_interrupts() -> N
     ]
     filtered = filter_interrupt_messages(interrupt_inputs, frozenset({"known_1"}))
     assert [getattr(message, "message_id", None) for message in filtered] == ["u_2", None]
+
+
+@pytest.mark.asyncio
+async def test_proactive_mark_triggered_many_isolates_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    """批量标记应共用触发时间戳，单个 stream 失败不影响其余 stream。"""
+    from contextlib import asynccontextmanager
+
+    from plugins.kokoro_flow_chatter.thinker.proactive import ProactiveThinker
+
+    sessions = {
+        "stream_a": SimpleNamespace(
+            stream_id="stream_a",
+            scheduled_proactive_reason="想你",
+            scheduled_proactive_at=50.0,
+            last_proactive_at=0.0,
+        ),
+        "stream_c": SimpleNamespace(
+            stream_id="stream_c",
+            scheduled_proactive_reason="",
+            scheduled_proactive_at=None,
+            last_proactive_at=0.0,
+        ),
+    }
+
+    class _FakeStore:
+        """最小 session store 替身。"""
+
+        def __init__(self) -> None:
+            self.saved: list[str] = []
+
+        @asynccontextmanager
+        async def lock(self, stream_id: str) -> Any:
+            _ = stream_id
+            yield
+
+        async def get(self, stream_id: str) -> Any:
+            if stream_id == "stream_bad":
+                raise RuntimeError("存储损坏")
+            return sessions.get(stream_id)
+
+        async def save(self, session: Any) -> None:
+            self.saved.append(session.stream_id)
+
+    store = _FakeStore()
+    thinker = ProactiveThinker(config=cast(Any, SimpleNamespace()), session_store=cast(Any, store))
+    monkeypatch.setattr("plugins.kokoro_flow_chatter.thinker.proactive.time.time", lambda: 100.0)
+
+    reasons = await thinker.mark_triggered_many(["stream_a", "stream_bad", "stream_c", "stream_missing"])
+
+    assert reasons == {"stream_a": "想你", "stream_c": "", "stream_missing": ""}
+    assert list(reasons) == ["stream_a", "stream_c", "stream_missing"]
+    assert sorted(store.saved) == ["stream_a", "stream_c"]
+    assert sessions["stream_a"].last_proactive_at == 100.0
+    assert sessions["stream_c"].last_proactive_at == 100.0
+    assert sessions["stream_a"].scheduled_proactive_at is None
+    assert sessions["stream_a"].scheduled_proactive_reason == ""
+    assert await thinker.mark_triggered_many([]) == {}
+
+
+def test_mental_log_to_list_cache_reuse_and_invalidation() -> None:
+    """to_list() 应复用序列化结果，add()/裁剪/clear() 后失效，返回值可随意增删。"""
+    from plugins.kokoro_flow_chatter.mental_log import MentalLog, MentalLogEntry
+    from plugins.kokoro_flow_chatter.models import KFCEventType
+
+    log = MentalLog(max_entries=2)
+    log.add(MentalLogEntry(event_type=KFCEventType.BOT_PLANNING, timestamp=1.0, thought="一"))
+
+    first = log.to_list()
+    second = log.to_list()
+    assert first == second
+    assert first is not second
+    assert first[0] is second[0]
+
+    first.append({"thought": "污染"})
+    first.pop(0)
+    assert [item["thought"] for item in log.to_list()] == ["一"]
+
+    log.add(MentalLogEntry(event_type=KFCEventType.BOT_PLANNING, timestamp=2.0, thought="二"))
+    after_add = log.to_list()
+    assert [item["thought"] for item in after_add] == ["一", "二"]
+    assert after_add[0] is not second[0]
+
+    log.add(MentalLogEntry(event_type=KFCEventType.BOT_PLANNING, timestamp=3.0, thought="三"))
+    assert [item["thought"] for item in log.to_list()] == ["二", "三"]
+
+    log.clear()
+    assert log.to_list() == []
+
+
+class _FakeJSONStore:
+    """最小 JSONStore 替身：会话数据存内存，索引文件落在临时目录。"""
+
+    def __init__(self, storage_dir: Path) -> None:
+        self._storage_dir = storage_dir
+        self.saved: dict[str, dict[str, Any]] = {}
+
+    def get_storage_dir(self) -> Path:
+        return self._storage_dir
+
+    async def save(self, key: str, data: dict[str, Any]) -> None:
+        self.saved[key] = data
+
+    async def load(self, key: str) -> dict[str, Any] | None:
+        return self.saved.get(key)
+
+
+def _make_session_store(tmp_path: Path) -> Any:
+    """构造使用 _FakeJSONStore 的 KFCSessionStore。"""
+    from plugins.kokoro_flow_chatter.session import KFCSessionStore
+
+    store = KFCSessionStore()
+    store._json_store = _FakeJSONStore(tmp_path)
+    store._store_initialized = True
+    return store
+
+
+@pytest.mark.asyncio
+async def test_session_store_skips_unchanged_index_entries(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """(platform, user_id) 未变化时 save() 不应再读写 _index.json，变化后应重写条目。"""
+    import asyncio
+    import json
+
+    from plugins.kokoro_flow_chatter.session import KFCSession
+
+    store = _make_session_store(tmp_path)
+    index_path = tmp_path / "_index.json"
+    io_calls: list[str] = []
+    real_to_thread = asyncio.to_thread
+
+    async def _tracking_to_thread(func: Any, *args: Any, **kwargs: Any) -> Any:
+        io_calls.append(getattr(func, "__name__", ""))
+        return await real_to_thread(func, *args, **kwargs)
+
+    monkeypatch.setattr("plugins.kokoro_flow_chatter.session.asyncio.to_thread", _tracking_to_thread)
+
+    session = KFCSession(user_id="10001", stream_id="stream-a", platform="qq")
+    await store.save(session)
+    assert io_calls == ["read_bytes", "write_bytes"]
+    assert json.loads(index_path.read_text(encoding="utf-8")) == {
+        "stream-a": {"platform": "qq", "user_id": "10001"},
+    }
+
+    io_calls.clear()
+    await store.save(session)
+    assert io_calls == []
+
+    session.user_id = "10002"
+    await store.save(session)
+    assert io_calls == ["read_bytes", "write_bytes"]
+    assert json.loads(index_path.read_text(encoding="utf-8")) == {
+        "stream-a": {"platform": "qq", "user_id": "10002"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_session_store_concurrent_saves_keep_all_index_entries(tmp_path: Path) -> None:
+    """不同 stream 并发 save() 时，_index.json 应同时保留两条记录。"""
+    import asyncio
+    import json
+
+    from plugins.kokoro_flow_chatter.session import KFCSession
+
+    store = _make_session_store(tmp_path)
+    await asyncio.gather(
+        store.save(KFCSession(user_id="10001", stream_id="stream-a", platform="qq")),
+        store.save(KFCSession(user_id="10002", stream_id="stream-b", platform="qq")),
+    )
+
+    assert json.loads((tmp_path / "_index.json").read_text(encoding="utf-8")) == {
+        "stream-a": {"platform": "qq", "user_id": "10001"},
+        "stream-b": {"platform": "qq", "user_id": "10002"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_session_store_locks_live_only_while_referenced() -> None:
+    """持有或等待期间 _get_lock 返回同一把锁，释放且无引用后条目自动消失。"""
+    import asyncio
+    import gc
+
+    from plugins.kokoro_flow_chatter.session import KFCSessionStore
+
+    store = KFCSessionStore()
+    lock = store._get_lock("stream-a")
+    assert store._get_lock("stream-a") is lock
+
+    await lock.acquire()
+    order: list[str] = []
+
+    async def _waiter() -> None:
+        async with store.lock("stream-a"):
+            order.append("waiter")
+
+    task = asyncio.create_task(_waiter())
+    await asyncio.sleep(0)
+    assert store._get_lock("stream-a") is lock
+
+    # 仅剩等待中的协程引用该锁时，条目仍应保留
+    del lock
+    gc.collect()
+    assert "stream-a" in store._locks
+
+    store._locks["stream-a"].release()
+    await task
+    assert order == ["waiter"]
+
+    gc.collect()
+    assert "stream-a" not in store._locks
+
+
+def test_proactive_quiet_hours_bounds_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """勿扰时段应正确处理普通区间、跨午夜与格式错误，配置变化后重新解析。"""
+    from plugins.kokoro_flow_chatter.thinker.proactive import ProactiveThinker
+
+    proactive_config = SimpleNamespace(quiet_hours_start="09:00", quiet_hours_end="17:30")
+    thinker = ProactiveThinker(
+        config=cast(Any, SimpleNamespace(proactive=proactive_config)),
+        session_store=cast(Any, SimpleNamespace()),
+    )
+    clock = SimpleNamespace(tm_hour=12, tm_min=0)
+    monkeypatch.setattr("plugins.kokoro_flow_chatter.thinker.proactive.time.localtime", lambda: clock)
+
+    def _quiet_at(hour: int, minute: int) -> bool:
+        clock.tm_hour, clock.tm_min = hour, minute
+        return thinker._is_quiet_hours()
+
+    assert thinker._get_quiet_bounds() == (540, 1050)
+    assert _quiet_at(12, 0) is True
+    assert _quiet_at(17, 30) is False
+    assert _quiet_at(8, 59) is False
+
+    proactive_config.quiet_hours_start = "23:00"
+    proactive_config.quiet_hours_end = "07:00"
+    assert thinker._get_quiet_bounds() == (1380, 420)
+    assert _quiet_at(23, 30) is True
+    assert _quiet_at(6, 59) is True
+    assert _quiet_at(12, 0) is False
+
+    proactive_config.quiet_hours_start = "bad"
+    assert thinker._get_quiet_bounds() is None
+    assert _quiet_at(23, 30) is False
+
+    proactive_config.quiet_hours_start = "22:15"
+    assert thinker._get_quiet_bounds() == (1335, 420)
+    assert _quiet_at(22, 20) is True
+
+
+@pytest.mark.asyncio
+async def test_reply_action_last_line_metadata_truncation() -> None:
+    """最后防线：仅当两类以上元数据关键字出现时，从最早命中处截断。"""
+    from plugins.kokoro_flow_chatter.actions.reply import KFCReplyAction
+
+    sent: list[str] = []
+
+    async def _send_to_stream(text: str) -> bool:
+        sent.append(text)
+        return True
+
+    action = KFCReplyAction.__new__(KFCReplyAction)
+    cast(Any, action)._send_to_stream = _send_to_stream
+
+    cases = [
+        # 两类关键字：从最早出现的 mood 处截断，而非模式列表中靠前的 thought
+        ("你好呀 mood: 开心 thought: 想见你", "你好呀"),
+        ("开头 预计反应: 回我 思考: 想", "开头"),
+        # 同一类关键字出现两次不算泄漏
+        ("你好 thought: 一 思考: 二", "你好 thought: 一 思考: 二"),
+        # 全角冒号
+        ("好的 想法：想你 心情：开心", "好的"),
+        # 不含冒号的内容原样发送
+        ("今天心情很好，想法很多", "今天心情很好，想法很多"),
+    ]
+    for content, expected in cases:
+        ok, _ = await action.execute(content)
+        assert ok is True
+        assert sent[-1] == expected
+
+    ok, detail = await action.execute("thought: 想 mood: 开心")
+    assert ok is False
+    assert detail == "清洗后内容为空，未发送"
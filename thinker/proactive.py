@@ -6,6 +6,7 @@ ProactiveThinker 负责在长时间沉默后评估是否主动发起对话。
 
 from __future__ import annotations
 
+import asyncio
 import random
 import time
 from typing import TYPE_CHECKING
@@ -33,6 +34,9 @@ class ProactiveThinker:
     ) -> None:
         self._config = config
         self._session_store = session_store
+        # 勿扰时段解析缓存：(原始 start, 原始 end, (start_minutes, end_minutes) | None)
+        # 以原始字符串为键，配置热更新后自动重新解析
+        self._quiet_bounds_cache: tuple[str, str, tuple[int, int] | None] | None = None
 
     async def check_all_sessions(self) -> list[str]:
         """检查所有缓存中的 Session，返回需要主动发起的 stream_id 列表。"""
@@ -41,14 +45,16 @@ class ProactiveThinker:
             return []
 
         # 注意：勿扰时段只对沉默触发生效，模型预约不受限制
-        # 勿扰时段检查已移入 _should_trigger
+        # 本轮检查共用同一时间点与勿扰判定，不在逐个 session 的循环内重复计算
+        now = time.time()
+        in_quiet_hours = self._is_quiet_hours()
 
         triggered: list[str] = []
 
         # 检查内存中的 session（完整逻辑：预约 + 沉默触发）
         cached_sessions = self._session_store.get_all_cached()
         for stream_id, session in cached_sessions.items():
-            if await self._check_and_trigger(stream_id, session):
+            if self._check_and_trigger(stream_id, session, now, in_quiet_hours):
                 triggered.append(stream_id)
 
         # 检查磁盘上未在内存中的 session（仅检查预约，避免大量沉默触发）
@@ -60,38 +66,41 @@ class ProactiveThinker:
             if session is None:
                 continue
             if session.scheduled_proactive_at is not None:
-                now = time.time()
                 if now >= session.scheduled_proactive_at:
                     logger.info(f"主动思考（磁盘 session）：触发预约 stream={stream_id[:8]}")
                     triggered.append(stream_id)
 
         return triggered
 
-    async def _check_and_trigger(self, stream_id: str, session: KFCSession) -> bool:
-        """检查单个 session 是否应触发，处理过期预约的持久化清除。"""
-        now = time.time()
+    def _check_and_trigger(
+        self,
+        stream_id: str,
+        session: KFCSession,
+        now: float,
+        in_quiet_hours: bool,
+    ) -> bool:
+        """检查单个 session 是否应触发（预约优先，其次沉默触发）。"""
         if session.scheduled_proactive_at is not None:
             if now >= session.scheduled_proactive_at:
                 logger.info(f"主动思考：触发模型预约 stream={stream_id[:8]}")
                 return True
             return False
 
-        return self._should_trigger(session)
+        if in_quiet_hours:
+            return False
+        return self._should_trigger(session, now)
 
-    def _should_trigger(self, session: KFCSession) -> bool:
+    def _should_trigger(self, session: KFCSession, now: float) -> bool:
         """判断无预约情况下是否应主动发起（沉默条件 + 概率）。
 
-        勿扰时段只在本路径（沉默触发）中检查，模型预约不受此限制。
+        勿扰时段由调用方在本轮检查开始时统一判定，只拦截沉默触发，
+        模型预约不受此限制。
 
         Args:
             session: KFC 会话对象
+            now: 本轮检查的时间戳
         """
-        # 勿扰时段：仅拦截沉默触发，不影响模型预约
-        if self._is_quiet_hours():
-            return False
-
         proactive_config = self._config.proactive
-        now = time.time()
 
         # 检查最后活动时间
         silence_duration = now - session.last_activity_at
@@ -114,31 +123,52 @@ class ProactiveThinker:
         )
         return True
 
-    def _is_quiet_hours(self) -> bool:
-        """检查当前是否在勿扰时段。"""
+    def _get_quiet_bounds(self) -> tuple[int, int] | None:
+        """解析勿扰时段为 (起始分钟, 结束分钟)，格式错误时返回 None。"""
         proactive_config = self._config.proactive
+        start_raw = proactive_config.quiet_hours_start
+        end_raw = proactive_config.quiet_hours_end
 
-        try:
-            now = time.localtime()
-            current_minutes = now.tm_hour * 60 + now.tm_min
+        cache = self._quiet_bounds_cache
+        if cache is not None and cache[0] == start_raw and cache[1] == end_raw:
+            return cache[2]
 
-            start_parts = proactive_config.quiet_hours_start.split(":")
+        bounds: tuple[int, int] | None
+        try:
+            start_parts = start_raw.split(":")
             start_minutes = int(start_parts[0]) * 60 + int(start_parts[1])
 
-            end_parts = proactive_config.quiet_hours_end.split(":")
+            end_parts = end_raw.split(":")
             end_minutes = int(end_parts[0]) * 60 + int(end_parts[1])
+            bounds = (start_minutes, end_minutes)
+        except (ValueError, IndexError):
+            bounds = None
 
-            if start_minutes <= end_minutes:
-                return start_minutes <= current_minutes < end_minutes
-            # 跨午夜
-            return current_minutes >= start_minutes or current_minutes < end_minutes
+        self._quiet_bounds_cache = (start_raw, end_raw, bounds)
+        return bounds
 
-        except (ValueError, IndexError):
+    def _is_quiet_hours(self) -> bool:
+        """检查当前是否在勿扰时段。"""
+        bounds = self._get_quiet_bounds()
+        if bounds is None:
             return False
+        start_minutes, end_minutes = bounds
+
+        now = time.localtime()
+        current_minutes = now.tm_hour * 60 + now.tm_min
 
-    async def mark_triggered(self, stream_id: str) -> str:
+        if start_minutes <= end_minutes:
+            return start_minutes <= current_minutes < end_minutes
+        # 跨午夜
+        return current_minutes >= start_minutes or current_minutes < end_minutes
+
+    async def mark_triggered(self, stream_id: str, now: float | None = None) -> str:
         """标记 Session 已触发主动发起，同时清除模型预约。
 
+        Args:
+            stream_id: 流 ID
+            now: 写入 last_proactive_at 的时间戳，默认取当前时间
+
         Returns:
             str: 清除前的预约理由，无预约时为空字符串。
         """
@@ -146,9 +176,35 @@ class ProactiveThinker:
             session = await self._session_store.get(stream_id)
             if session:
                 reason = session.scheduled_proactive_reason
-                session.last_proactive_at = time.time()
+                session.last_proactive_at = now if now is not None else time.time()
                 session.scheduled_proactive_at = None   # 清除已消费的预约
                 session.scheduled_proactive_reason = ""  # 同步清除预约理由
                 await self._session_store.save(session)
                 return reason
         return ""
+
+    async def mark_triggered_many(self, stream_ids: list[str]) -> dict[str, str]:
+        """并发标记多个 Session 已触发主动发起。
+
+        各 stream 仍在各自的锁内读写，不同 stream 之间的存储 IO 并发进行；
+        同一批次共用同一个触发时间戳。单个 stream 标记失败只记录日志，
+        不影响其余 stream。
+
+        Returns:
+            dict[str, str]: 标记成功的 stream_id → 清除前的预约理由，
+            按 stream_ids 顺序排列，失败的 stream 不在其中
+        """
+        if not stream_ids:
+            return {}
+        now = time.time()
+        outcomes = await asyncio.gather(
+            *(self.mark_triggered(stream_id, now) for stream_id in stream_ids),
+            return_exceptions=True,
+        )
+        reasons: dict[str, str] = {}
+        for stream_id, outcome in zip(stream_ids, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"主动发起标记失败 (stream={stream_id[:8]}): {outcome}")
+                continue
+            reasons[stream_id] = outcome
+        return reasons